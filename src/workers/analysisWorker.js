@@ -1,3 +1,43 @@
+// Term lists are built once per worker rather than on every call.
+const COMMON_TERMS = [
+  'personal information', 'data collection', 'third party',
+  'cookies', 'tracking', 'analytics', 'advertising',
+  'user rights', 'opt out', 'delete', 'access'
+];
+
+const HIGH_RISK_INDICATORS = [
+  'sell', 'monetize', 'third party', 'partner',
+  'indefinitely', 'permanent', 'irrevocable'
+];
+
+const RISK_KEYWORDS = [
+  'collect', 'share', 'sell', 'transfer', 'store', 'retain',
+  'third party', 'partner', 'affiliate', 'advertiser'
+];
+
+// One alternation regex replaces a per-keyword includes() scan for every
+// sentence. Matches substrings, like includes(); keep it free of the g flag
+// so test() stays stateless.
+const RISK_KEYWORD_PATTERN = new RegExp(
+  RISK_KEYWORDS.map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')
+);
+
+// Checked in order; the first category with a matching keyword wins.
+const CLAUSE_CATEGORIES = [
+  ['dataCollection', ['collect', 'gather', 'obtain', 'receive']],
+  ['dataSharing', ['share', 'disclose', 'provide', 'transfer']],
+  ['dataRetention', ['retain', 'store', 'keep', 'maintain']],
+  ['userRights', ['right', 'access', 'delete', 'opt out']],
+  ['security', ['secure', 'protect', 'encrypt', 'safeguard']]
+];
+
+// Checked in order, highest risk first.
+const CLAUSE_RISK_LEVELS = [
+  [['sell', 'monetize', 'indefinitely', 'irrevocable'], 3],
+  [['share', 'third party', 'partner', 'affiliate'], 2],
+  [['protect', 'secure', 'opt out', 'delete'], 0.5]
+];
+
 self.onmessage = function(e) {
   const { type, data } = e.data;
   
@@ -19,13 +59,14 @@ self.onmessage = function(e) {
 function analyzePolicyText(policyData) {
   try {
     const { text, options = {} } = policyData;
+    const lowerText = text.toLowerCase();
     
     const analysis = {
       wordCount: text.split(/\s+/).length,
       readabilityScore: calculateReadabilityScore(text),
-      keyTerms: extractKeyTerms(text),
+      keyTerms: extractKeyTerms(lowerText),
       dataCollectionPatterns: findDataCollectionPatterns(text),
-      riskIndicators: identifyRiskIndicators(text),
+      riskIndicators: identifyRiskIndicators(lowerText),
       timestamp: Date.now()
     };
     
@@ -89,16 +130,7 @@ function extractClauses(extractionData) {
       const trimmed = sentence.trim();
       if (trimmed.length < 20) return;
       
-      const riskKeywords = [
-        'collect', 'share', 'sell', 'transfer', 'store', 'retain',
-        'third party', 'partner', 'affiliate', 'advertiser'
-      ];
-      
-      const hasRiskKeyword = riskKeywords.some(keyword => 
-        trimmed.toLowerCase().includes(keyword)
-      );
-      
-      if (hasRiskKeyword) {
+      if (RISK_KEYWORD_PATTERN.test(trimmed.toLowerCase())) {
         clauses.push({
           id: `clause_${index}`,
           text: trimmed,
@@ -141,16 +173,9 @@ function countSyllables(text) {
     .length || 1;
 }
 
-function extractKeyTerms(text) {
-  const commonTerms = [
-    'personal information', 'data collection', 'third party',
-    'cookies', 'tracking', 'analytics', 'advertising',
-    'user rights', 'opt out', 'delete', 'access'
-  ];
-  
-  return commonTerms.filter(term => 
-    text.toLowerCase().includes(term)
-  );
+// Expects text that has already been lowercased by the caller.
+function extractKeyTerms(lowerText) {
+  return COMMON_TERMS.filter(term => lowerText.includes(term));
 }
 
 function findDataCollectionPatterns(text) {
@@ -172,29 +197,15 @@ function findDataCollectionPatterns(text) {
   return matches;
 }
 
-function identifyRiskIndicators(text) {
-  const highRiskTerms = [
-    'sell', 'monetize', 'third party', 'partner',
-    'indefinitely', 'permanent', 'irrevocable'
-  ];
-  
-  return highRiskTerms.filter(term => 
-    text.toLowerCase().includes(term)
-  );
+// Expects text that has already been lowercased by the caller.
+function identifyRiskIndicators(lowerText) {
+  return HIGH_RISK_INDICATORS.filter(term => lowerText.includes(term));
 }
 
 function categorizeClause(text) {
-  const categories = {
-    dataCollection: ['collect', 'gather', 'obtain', 'receive'],
-    dataSharing: ['share', 'disclose', 'provide', 'transfer'],
-    dataRetention: ['retain', 'store', 'keep', 'maintain'],
-    userRights: ['right', 'access', 'delete', 'opt out'],
-    security: ['secure', 'protect', 'encrypt', 'safeguard']
-  };
-  
   const lowerText = text.toLowerCase();
   
-  for (const [category, keywords] of Object.entries(categories)) {
+  for (const [category, keywords] of CLAUSE_CATEGORIES) {
     if (keywords.some(keyword => lowerText.includes(keyword))) {
       return category;
     }
@@ -204,18 +215,12 @@ function categorizeClause(text) {
 }
 
 function assessClauseRisk(text) {
-  const highRiskTerms = ['sell', 'monetize', 'indefinitely', 'irrevocable'];
-  const mediumRiskTerms = ['share', 'third party', 'partner', 'affiliate'];
-  const lowRiskTerms = ['protect', 'secure', 'opt out', 'delete'];
-  
   const lowerText = text.toLowerCase();
   
-  if (highRiskTerms.some(term => lowerText.includes(term))) {
-    return 3;
-  } else if (mediumRiskTerms.some(term => lowerText.includes(term))) {
-    return 2;
-  } else if (lowRiskTerms.some(term => lowerText.includes(term))) {
-    return 0.5;
+  for (const [keywords, riskLevel] of CLAUSE_RISK_LEVELS) {
+    if (keywords.some(term => lowerText.includes(term))) {
+      return riskLevel;
+    }
   }
   
   return 1;